@@ -1,7 +1,7 @@
 """Configuration management for MCP Server."""
 
 from pydantic_settings import BaseSettings
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import json
 from pathlib import Path
 
@@ -21,6 +21,23 @@ class ServerSettings(BaseSettings):
     cors_origins: list[str] = ["*"]
 
 
+class JobSettings(BaseSettings):
+    """Background job queue settings."""
+    max_concurrency: int = 2  # Workers draining background jobs
+    interactive_concurrency: int = 4  # Separate limit for create/modify/state calls
+    persist_path: Optional[str] = None  # e.g. "jobs.json" to survive restarts
+    max_finished_jobs: int = 100  # Finished jobs (and results) kept for retrieval
+
+
+class LintSettings(BaseSettings):
+    """Design lint thresholds."""
+    min_contrast: float = 4.5  # WCAG AA, normal text
+    min_contrast_large: float = 3.0  # WCAG AA, large text
+    large_text_size: float = 24.0
+    min_touch_target: float = 44.0  # px, shortest side of tappable elements
+    brand_drift_threshold: float = 10.0  # CIE76 delta E to nearest brand color
+
+
 class ProjectConfig:
     """Project-specific configuration (brand colors, typography, etc)."""
 
@@ -68,6 +85,8 @@ class Settings(BaseSettings):
     """Main application settings."""
     penpot: PenPotSettings = PenPotSettings()
     server: ServerSettings = ServerSettings()
+    jobs: JobSettings = JobSettings()
+    lint: LintSettings = LintSettings()
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,361 @@
+"""Prioritised background job queue for long-running PenPot operations."""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from config import settings
+from models import JobKind, JobPriority, JobRequest, JobStatus
+from penpot_client import PenPotClient, penpot_client
+
+logger = logging.getLogger(__name__)
+
+# Lower rank runs first
+PRIORITY_RANK = {
+    JobPriority.INTERACTIVE: 0,
+    JobPriority.NORMAL: 1,
+    JobPriority.BULK: 2
+}
+
+# Operations safe to repeat if a restart interrupts them mid-step
+IDEMPOTENT_OPERATIONS = {"getState"}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class Job:
+    """A background job made of one or more plugin commands."""
+
+    def __init__(
+        self,
+        kind: JobKind,
+        priority: JobPriority,
+        steps: List[Dict[str, Any]],
+        job_id: Optional[str] = None
+    ):
+        self.id = job_id or uuid.uuid4().hex
+        self.kind = JobKind(kind)
+        self.priority = JobPriority(priority)
+        self.steps = steps
+        self.results: List[Dict[str, Any]] = []
+        self.status = JobStatus.QUEUED
+        self.error: Optional[Dict[str, Any]] = None
+        self.created_at = _now()
+        self.finished_at: Optional[str] = None
+        # Index of a step sent to PenPot whose result is not yet recorded
+        self.in_flight: Optional[int] = None
+
+    @property
+    def completed(self) -> int:
+        return len(self.results)
+
+    @property
+    def progress(self) -> float:
+        return self.completed / len(self.steps) if self.steps else 1.0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    @property
+    def result(self) -> Optional[Dict[str, Any]]:
+        """Job output; state jobs return the design state, batches every step result."""
+        if self.kind == JobKind.STATE:
+            state = self.results[0] if self.results else {}
+            elements = state.get("elements", [])
+            return {"elements": elements, "total_count": len(elements)}
+        return {"results": self.results}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise job for on-disk persistence."""
+        return {
+            "id": self.id,
+            "kind": self.kind.value,
+            "priority": self.priority.value,
+            "steps": self.steps,
+            "results": list(self.results),
+            "status": self.status.value,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "in_flight": self.in_flight
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Job":
+        """Restore a job saved with to_dict."""
+        job = cls(data["kind"], data["priority"], data["steps"], job_id=data["id"])
+        job.results = data.get("results", [])
+        job.status = JobStatus(data["status"])
+        job.error = data.get("error")
+        job.created_at = data.get("created_at", job.created_at)
+        job.finished_at = data.get("finished_at")
+        job.in_flight = data.get("in_flight")
+        return job
+
+
+class JobScheduler:
+    """
+    In-process priority scheduler for PenPot work.
+
+    Background jobs are drained by a fixed pool of workers pulling from a
+    priority queue; jobs are re-queued after every step so higher-priority
+    jobs overtake at the next step boundary. Interactive calls made through
+    run() bypass that pool and have their own concurrency limit, so they
+    never wait behind in-flight job steps.
+
+    Steps run at most once: a step interrupted by shutdown or a crash is
+    only retried after a restart if its operation is idempotent (getState);
+    otherwise the job fails with JOB_INTERRUPTED rather than risk creating
+    the same shape twice.
+
+    With persistence on, persist_path holds only unfinished jobs and is
+    rewritten as they progress. Each finished job (with its results) is
+    written once to its own file in a "<stem>-finished" directory next to
+    it, and deleted when pruned.
+    """
+
+    def __init__(
+        self,
+        client: PenPotClient,
+        max_concurrency: int = 2,
+        persist_path: Optional[str] = None,
+        max_finished_jobs: int = 100,
+        interactive_concurrency: int = 4
+    ):
+        self.client = client
+        self.max_concurrency = max(1, max_concurrency)
+        self._interactive_slots = asyncio.Semaphore(max(1, interactive_concurrency))
+        self.persist_path = Path(persist_path) if persist_path else None
+        self.finished_dir = (
+            self.persist_path.parent / f"{self.persist_path.stem}-finished"
+            if self.persist_path else None
+        )
+        self.max_finished_jobs = max(0, max_finished_jobs)
+        self.jobs: Dict[str, Job] = {}
+        self._save_lock = asyncio.Lock()
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._counter = itertools.count()
+        self._workers: List[asyncio.Task] = []
+        self._stopped = False
+
+    async def start(self):
+        """Restore persisted jobs and start the worker pool."""
+        self._stopped = False
+        self._load()
+        self._workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(self.max_concurrency)
+        ]
+        logger.info(f"Job scheduler started with {self.max_concurrency} workers")
+
+    async def stop(self):
+        """Stop workers and refuse new work; unfinished jobs stay in the persist file."""
+        self._stopped = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        await self._save()
+
+    async def submit(self, request: JobRequest) -> Job:
+        """
+        Queue a background job.
+
+        Raises:
+            ValueError: If the request has no runnable commands
+            RuntimeError: If the scheduler has been stopped
+        """
+        if self._stopped:
+            raise RuntimeError("Job scheduler is shut down")
+
+        if request.kind == JobKind.STATE:
+            query = request.query.dict() if request.query else {}
+            steps = [{"operation": "getState", "query": query}]
+        else:
+            if not request.commands:
+                raise ValueError("commands required for batch job")
+            for command in request.commands:
+                if "operation" not in command:
+                    raise ValueError("every batch command needs an operation")
+            steps = list(request.commands)
+
+        job = Job(request.kind, request.priority, steps)
+        self.jobs[job.id] = job
+        self._enqueue(job)
+        await self._save()
+
+        logger.info(f"Queued {job.kind.value} job {job.id} ({len(steps)} steps, {job.priority.value})")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by id."""
+        return self.jobs.get(job_id)
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking interactive client call off the event loop.
+
+        Raises:
+            RuntimeError: If the scheduler has been stopped
+        """
+        async with self._interactive_slots:
+            if self._stopped:
+                raise RuntimeError("Job scheduler is shut down")
+            return await asyncio.to_thread(func, *args)
+
+    def _enqueue(self, job: Job, seq: Optional[int] = None):
+        if seq is None:
+            seq = next(self._counter)
+        self._queue.put_nowait((PRIORITY_RANK[job.priority], seq, job))
+
+    async def _worker(self):
+        while True:
+            _, seq, job = await self._queue.get()
+            try:
+                await self._run_step(job, seq)
+            except Exception as e:
+                logger.error(f"Job worker error: {e}", exc_info=True)
+            finally:
+                self._queue.task_done()
+
+    async def _run_step(self, job: Job, seq: int):
+        job.status = JobStatus.RUNNING
+        step = job.steps[job.completed]
+
+        # Mark the step before sending it so a restart knows it may have applied
+        job.in_flight = job.completed
+        await self._save()
+
+        try:
+            result = await asyncio.to_thread(self.client.execute_command, step)
+        except Exception as e:
+            await self._fail(job, str(e))
+            return
+
+        # The plugin reports command errors as {"success": false, "error": ...}
+        if isinstance(result, dict) and result.get("success") is False:
+            await self._fail(job, result.get("error") or f"{step['operation']} failed")
+            return
+
+        job.in_flight = None
+        job.results.append(result)
+        if job.completed < len(job.steps):
+            # Keep the original sequence number so the job holds its place
+            # among equal-priority work while letting higher ranks cut in.
+            self._enqueue(job, seq)
+            await self._save()
+        else:
+            job.status = JobStatus.SUCCEEDED
+            job.finished_at = _now()
+            logger.info(f"Job {job.id} succeeded")
+            await self._finish(job)
+
+    async def _fail(self, job: Job, message: str):
+        logger.error(f"Job {job.id} failed at step {job.completed}: {message}")
+        job.in_flight = None
+        job.status = JobStatus.FAILED
+        job.error = {"code": "JOB_FAILED", "message": message}
+        job.finished_at = _now()
+        await self._finish(job)
+
+    async def _finish(self, job: Job):
+        """Persist a finished job once, drop it from the unfinished file and prune."""
+        if self.finished_dir:
+            await asyncio.to_thread(self._write, self.finished_dir / f"{job.id}.json", job.to_dict())
+        pruned = self._prune()
+        if pruned and self.finished_dir:
+            await asyncio.to_thread(self._delete_finished, pruned)
+        await self._save()
+
+    def _prune(self) -> List[str]:
+        """Forget the oldest finished jobs beyond max_finished_jobs; returns their ids."""
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        pruned = finished[:max(0, len(finished) - self.max_finished_jobs)]
+        for job_id in pruned:
+            del self.jobs[job_id]
+        return pruned
+
+    def _delete_finished(self, job_ids: List[str]):
+        for job_id in job_ids:
+            (self.finished_dir / f"{job_id}.json").unlink(missing_ok=True)
+
+    def _load(self):
+        if not self.persist_path:
+            return
+
+        # Finished jobs first, oldest first, so pruning drops the oldest
+        finished = []
+        if self.finished_dir.exists():
+            for path in self.finished_dir.glob("*.json"):
+                with open(path) as f:
+                    finished.append(Job.from_dict(json.load(f)))
+        for job in sorted(finished, key=lambda j: j.finished_at or ""):
+            self.jobs[job.id] = job
+
+        saved = []
+        if self.persist_path.exists():
+            with open(self.persist_path) as f:
+                saved = json.load(f)
+
+        for data in saved:
+            job = Job.from_dict(data)
+            # A crash between writing the finished file and the unfinished one
+            # leaves the job in both; the finished copy wins
+            if job.id in self.jobs or job.finished:
+                continue
+            self.jobs[job.id] = job
+
+            if job.in_flight is not None and job.steps[job.in_flight]["operation"] not in IDEMPOTENT_OPERATIONS:
+                logger.warning(f"Job {job.id} was interrupted at step {job.in_flight}; not retrying")
+                job.status = JobStatus.FAILED
+                job.error = {
+                    "code": "JOB_INTERRUPTED",
+                    "message": f"Step {job.in_flight} was interrupted and may already have been applied"
+                }
+                job.finished_at = _now()
+                self._write(self.finished_dir / f"{job.id}.json", job.to_dict())
+                continue
+
+            job.in_flight = None
+            job.status = JobStatus.QUEUED
+            self._enqueue(job)
+
+        self._delete_finished(self._prune())
+        logger.info(f"Restored {len(self.jobs)} jobs from {self.persist_path}")
+
+    async def _save(self):
+        """Rewrite the unfinished-jobs file; finished results are never rewritten."""
+        if not self.persist_path:
+            return
+
+        # Serialise saves so an older snapshot never overwrites a newer one
+        async with self._save_lock:
+            snapshot = [job.to_dict() for job in self.jobs.values() if not job.finished]
+            await asyncio.to_thread(self._write, self.persist_path, snapshot)
+
+    def _write(self, path: Path, data: Any):
+        # Write-then-rename so a crash never leaves a truncated file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+
+# Global scheduler instance
+job_scheduler = JobScheduler(
+    penpot_client,
+    max_concurrency=settings.jobs.max_concurrency,
+    persist_path=settings.jobs.persist_path,
+    max_finished_jobs=settings.jobs.max_finished_jobs,
+    interactive_concurrency=settings.jobs.interactive_concurrency
+)
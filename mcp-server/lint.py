@@ -0,0 +1,315 @@
+"""Design lint checks: WCAG contrast, touch-target size and brand-color drift."""
+
+import json
+import logging
+import re
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from config import LintSettings, project_config, settings
+
+logger = logging.getLogger(__name__)
+
+HEX_COLOR = re.compile(r'^#[0-9A-Fa-f]{6}$')
+
+# Name keywords marking elements users tap or click
+INTERACTIVE_KEYWORDS = ("button", "cta", "link", "tab", "toggle", "checkbox", "icon")
+INTERACTIVE_NAME = re.compile(rf'\b(?:{"|".join(INTERACTIVE_KEYWORDS)})s?\b')
+
+# sRGB (D65) to XYZ, and D65 reference white
+SRGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041]
+])
+D65_WHITE = np.array([0.95047, 1.0, 1.08883])
+
+# Below this delta E a fill counts as the brand color itself
+EXACT_COLOR_DELTA = 1.0
+
+
+def hex_to_rgb(colors: List[str]) -> np.ndarray:
+    """Convert '#RRGGBB' strings to an (N, 3) array of 0-1 floats."""
+    values = np.array([int(c[1:], 16) for c in colors], dtype=np.int64)
+    channels = np.stack([(values >> 16) & 0xFF, (values >> 8) & 0xFF, values & 0xFF], axis=-1)
+    return channels.reshape(-1, 3) / 255.0
+
+
+def _linearize(rgb: np.ndarray) -> np.ndarray:
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def relative_luminance(rgb: np.ndarray) -> np.ndarray:
+    """WCAG 2 relative luminance of each row of an (N, 3) sRGB array."""
+    return _linearize(rgb) @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def contrast_ratio(fg: np.ndarray, bg: np.ndarray) -> np.ndarray:
+    """WCAG 2 contrast ratio between matching rows of two (N, 3) sRGB arrays."""
+    l1 = relative_luminance(fg)
+    l2 = relative_luminance(bg)
+    return (np.maximum(l1, l2) + 0.05) / (np.minimum(l1, l2) + 0.05)
+
+
+def rgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """Convert an (N, 3) sRGB array to CIELAB."""
+    xyz = (_linearize(rgb) @ SRGB_TO_XYZ.T) / D65_WHITE
+    epsilon, kappa = 216 / 24389, 24389 / 27
+    f = np.where(xyz > epsilon, np.cbrt(xyz), (kappa * xyz + 16) / 116)
+    return np.stack([
+        116 * f[:, 1] - 16,
+        500 * (f[:, 0] - f[:, 1]),
+        200 * (f[:, 1] - f[:, 2])
+    ], axis=-1)
+
+
+def _number(value: Any, default: float) -> float:
+    """Parse a numeric plugin value; Penpot sends some as strings or "mixed"."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return default
+    return number if np.isfinite(number) else default
+
+
+def _fill(element: Dict[str, Any]) -> Tuple[Optional[str], float]:
+    """First hex fill of an element and its opacity, if any."""
+    for fill in element.get("fills") or []:
+        color = fill.get("fillColor") if isinstance(fill, dict) else None
+        if color and HEX_COLOR.match(color):
+            opacity = _number(fill.get("fillOpacity"), 1.0)
+            return color.upper(), min(max(opacity, 0.0), 1.0)
+    return None, 1.0
+
+
+def _fingerprint(element: Dict[str, Any]) -> str:
+    """Stable summary of the fields the checks read."""
+    return json.dumps([
+        element.get("name"),
+        element.get("type"),
+        element.get("x"),
+        element.get("y"),
+        element.get("width"),
+        element.get("height"),
+        _fill(element),
+        element.get("fontSize")
+    ])
+
+
+class DesignLinter:
+    """
+    Batched design lint engine with per-element result caching.
+
+    Every check runs as one NumPy operation over all elements that need
+    it. Results are cached per project and element; a later run only
+    re-checks elements whose geometry, fill or name changed (or, for
+    text, whose background did).
+    """
+
+    def __init__(self, lint_settings: Optional[LintSettings] = None):
+        self.settings = lint_settings or settings.lint
+        # project -> element_id -> (fingerprint, issues)
+        self._cache: Dict[str, Dict[str, Tuple[str, List[Dict[str, Any]]]]] = {}
+        self._palettes: Dict[str, str] = {}
+
+    def lint(
+        self,
+        elements: List[Dict[str, Any]],
+        project: str = "compel-english",
+        full: bool = False
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Lint design elements.
+
+        Args:
+            elements: Element dicts as returned by getState
+            project: Project name for the brand palette
+            full: Ignore cached results and re-check everything
+
+        Returns:
+            Tuple of (issues for all elements, number of elements re-checked)
+        """
+        elements = [e for e in elements if e.get("id")]
+        brand_colors = {
+            name: color.upper()
+            for name, color in project_config.get_project(project).get("brand_colors", {}).items()
+            if isinstance(color, str) and HEX_COLOR.match(color)
+        }
+
+        palette_key = json.dumps(brand_colors, sort_keys=True)
+        if full or self._palettes.get(project) != palette_key:
+            self._cache[project] = {}
+            self._palettes[project] = palette_key
+        cache = self._cache.setdefault(project, {})
+
+        n = len(elements)
+        ids = [e["id"] for e in elements]
+        geometry = np.array(
+            [[e.get(k) or 0 for k in ("x", "y", "width", "height")] for e in elements],
+            dtype=float
+        ).reshape(n, 4)
+        x, y, width, height = geometry.T
+        colors, opacity = zip(*[_fill(e) for e in elements]) if n else ((), ())
+        has_fill = np.array([c is not None for c in colors], dtype=bool)
+        fills = hex_to_rgb([c or "#FFFFFF" for c in colors])
+        opacity = np.array(opacity, dtype=float)
+        is_text = np.array([e.get("type") == "text" for e in elements], dtype=bool)
+        # Unknown or "mixed" sizes get the stricter normal-text threshold
+        font_size = np.array([_number(e.get("fontSize"), 0.0) for e in elements], dtype=float)
+        # Whole-word name match; boards are containers, never tap targets
+        is_interactive = np.array([
+            e.get("type") not in ("text", "board")
+            and INTERACTIVE_NAME.search((e.get("name") or "").lower()) is not None
+            for e in elements
+        ], dtype=bool)
+
+        # Translucent shapes don't count as backgrounds; the opaque shape beneath does
+        background = self._find_backgrounds(x, y, width, height, has_fill & ~is_text & (opacity >= 1), is_text)
+
+        # Text results also depend on the element behind them
+        own = [_fingerprint(e) for e in elements]
+        fingerprints = [
+            own[i] + (f"|{ids[background[i]]}:{own[background[i]]}" if background[i] >= 0 else "")
+            for i in range(n)
+        ]
+        dirty = np.array(
+            [cache.get(ids[i], (None,))[0] != fingerprints[i] for i in range(n)],
+            dtype=bool
+        )
+
+        issues: Dict[int, List[Dict[str, Any]]] = {int(i): [] for i in np.flatnonzero(dirty)}
+        self._check_contrast(dirty & is_text & has_fill, fills, opacity, background, font_size, issues)
+        self._check_touch_targets(dirty & is_interactive, width, height, issues)
+        self._check_brand_drift(dirty & has_fill, fills, colors, brand_colors, issues)
+
+        for i, element_issues in issues.items():
+            for issue in element_issues:
+                issue["element_id"] = ids[i]
+                issue["element_name"] = elements[i].get("name")
+            cache[ids[i]] = (fingerprints[i], element_issues)
+
+        # Forget elements that no longer exist
+        for stale_id in set(cache) - set(ids):
+            del cache[stale_id]
+
+        checked = len(issues)
+        logger.info(f"Linted {n} elements ({checked} re-checked) for {project}")
+
+        return [issue for element_id in ids for issue in cache[element_id][1]], checked
+
+    def _find_backgrounds(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        width: np.ndarray,
+        height: np.ndarray,
+        candidates: np.ndarray,
+        is_text: np.ndarray
+    ) -> np.ndarray:
+        """Index of the smallest filled shape under each text element's center, else -1."""
+        background = np.full(len(x), -1, dtype=int)
+        if not candidates.any() or not is_text.any():
+            return background
+
+        text_idx = np.flatnonzero(is_text)
+        cand_idx = np.flatnonzero(candidates)
+        cx = (x[text_idx] + width[text_idx] / 2)[:, None]
+        cy = (y[text_idx] + height[text_idx] / 2)[:, None]
+        inside = (
+            (x[cand_idx] <= cx) & (cx <= x[cand_idx] + width[cand_idx])
+            & (y[cand_idx] <= cy) & (cy <= y[cand_idx] + height[cand_idx])
+        )
+
+        area = np.where(inside, (width[cand_idx] * height[cand_idx])[None, :], np.inf)
+        smallest = area.argmin(axis=1)
+        found = inside.any(axis=1)
+        background[text_idx[found]] = cand_idx[smallest[found]]
+        return background
+
+    def _check_contrast(
+        self,
+        mask: np.ndarray,
+        fills: np.ndarray,
+        opacity: np.ndarray,
+        background: np.ndarray,
+        font_size: np.ndarray,
+        issues: Dict[int, List[Dict[str, Any]]]
+    ):
+        idx = np.flatnonzero(mask)
+        if not len(idx):
+            return
+
+        # Text with nothing filled behind it sits on the white canvas
+        bg = np.where((background[idx] >= 0)[:, None], fills[background[idx]], 1.0)
+        # Translucent text shows the background through it
+        alpha = opacity[idx][:, None]
+        fg = alpha * fills[idx] + (1 - alpha) * bg
+        ratio = contrast_ratio(fg, bg)
+        large = font_size[idx] >= self.settings.large_text_size
+        threshold = np.where(large, self.settings.min_contrast_large, self.settings.min_contrast)
+
+        for i, r, t in zip(idx[ratio < threshold], ratio[ratio < threshold], threshold[ratio < threshold]):
+            issues[int(i)].append({
+                "rule": "contrast",
+                "severity": "error",
+                "message": f"Contrast {r:.2f}:1 fails WCAG AA (needs {t:.1f}:1)",
+                "value": round(float(r), 2),
+                "threshold": float(t)
+            })
+
+    def _check_touch_targets(
+        self,
+        mask: np.ndarray,
+        width: np.ndarray,
+        height: np.ndarray,
+        issues: Dict[int, List[Dict[str, Any]]]
+    ):
+        idx = np.flatnonzero(mask)
+        if not len(idx):
+            return
+
+        shortest = np.minimum(width[idx], height[idx])
+        too_small = shortest < self.settings.min_touch_target
+
+        for i, size in zip(idx[too_small], shortest[too_small]):
+            issues[int(i)].append({
+                "rule": "touch_target",
+                "severity": "warning",
+                "message": f"Touch target {size:.0f}px is smaller than {self.settings.min_touch_target:.0f}px for mobile",
+                "value": float(size),
+                "threshold": self.settings.min_touch_target
+            })
+
+    def _check_brand_drift(
+        self,
+        mask: np.ndarray,
+        fills: np.ndarray,
+        colors: List[Optional[str]],
+        brand_colors: Dict[str, str],
+        issues: Dict[int, List[Dict[str, Any]]]
+    ):
+        idx = np.flatnonzero(mask)
+        if not len(idx) or not brand_colors:
+            return
+
+        brand_names = list(brand_colors)
+        brand_lab = rgb_to_lab(hex_to_rgb([brand_colors[name] for name in brand_names]))
+        distance = np.linalg.norm(rgb_to_lab(fills[idx])[:, None, :] - brand_lab[None, :, :], axis=-1)
+        nearest = distance.argmin(axis=1)
+        delta = distance[np.arange(len(idx)), nearest]
+        drifted = (delta >= EXACT_COLOR_DELTA) & (delta <= self.settings.brand_drift_threshold)
+
+        for i, brand, d in zip(idx[drifted], nearest[drifted], delta[drifted]):
+            name = brand_names[brand]
+            issues[int(i)].append({
+                "rule": "brand_color",
+                "severity": "warning",
+                "message": f"Fill {colors[i]} is close to brand {name} {brand_colors[name]} (delta E {d:.1f})",
+                "value": round(float(d), 2),
+                "threshold": self.settings.brand_drift_threshold
+            })
+
+
+# Global linter instance
+design_linter = DesignLinter()
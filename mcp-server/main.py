@@ -2,7 +2,7 @@
 
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
@@ -12,8 +12,15 @@ from models import (
     DesignResponse,
     StateQuery,
     StateResponse,
-    HealthResponse
+    HealthResponse,
+    JobRequest,
+    JobResponse,
+    JobStatus,
+    LintRequest,
+    LintResponse
 )
+from jobs import Job, job_scheduler
+from lint import design_linter
 from penpot_client import penpot_client
 from translator import translator
 
@@ -40,9 +47,12 @@ async def lifespan(app: FastAPI):
     if not penpot_client.health_check():
         logger.warning("PenPot server not accessible at startup")
 
+    await job_scheduler.start()
+
     yield
 
     logger.info("Shutting down MCP Server...")
+    await job_scheduler.stop()
 
 
 # Create FastAPI app
@@ -80,35 +90,68 @@ async def create_design(request: DesignRequest):
     Create a new design element.
 
     This endpoint accepts natural language commands and translates them
-    to PenPot operations.
+    to PenPot operations. Compound commands ("a hero board with a heading
+    and two buttons") are created in a single plugin call.
     """
     try:
         logger.info(f"Create request: {request.dict()}")
 
         # If natural language provided, parse it
         if request.natural_language:
-            element_type, properties = translator.parse_command(
+            nodes = translator.parse_compound(
                 request.natural_language,
                 request.project or "compel-english"
             )
-            # Merge with explicit properties
-            properties.update(request.properties)
+            # Merge explicit properties into the root element
+            nodes[0]["properties"].update(request.properties)
+
+            if len(nodes) > 1:
+                result = await job_scheduler.run(penpot_client.create_tree, nodes)
+
+                # The plugin rolls back partial trees and lists what it removed
+                if result.get("success") is False:
+                    partial = result.get("data") or {}
+                    return DesignResponse(
+                        success=False,
+                        message="Failed to create elements",
+                        data={
+                            "elements": partial.get("elements", []),
+                            "rolled_back": partial.get("rolledBack", False)
+                        },
+                        error={
+                            "code": "CREATE_FAILED",
+                            "message": result.get("error") or "createTree failed"
+                        }
+                    )
+
+                return DesignResponse(
+                    success=True,
+                    message=f"Created {len(nodes)} elements: {nodes[0]['properties'].get('name', 'unnamed')}",
+                    element_id=result.get("id"),
+                    preview_url=f"{settings.penpot.url}/view/{result.get('id')}",
+                    data={"elements": result.get("elements", [])}
+                )
+
+            element_type = nodes[0]["element_type"]
+            properties = nodes[0]["properties"]
         else:
             element_type = request.element_type
             properties = request.properties
 
-        # Execute via PenPot client
+        # Execute via PenPot client (interactive priority)
         if element_type == "rectangle":
-            result = penpot_client.create_rectangle(properties)
+            create = penpot_client.create_rectangle
         elif element_type == "ellipse":
-            result = penpot_client.create_ellipse(properties)
+            create = penpot_client.create_ellipse
         elif element_type == "text":
-            result = penpot_client.create_text(properties)
+            create = penpot_client.create_text
         elif element_type == "board":
-            result = penpot_client.create_board(properties)
+            create = penpot_client.create_board
         else:
             raise ValueError(f"Unsupported element type: {element_type}")
 
+        result = await job_scheduler.run(create, properties)
+
         return DesignResponse(
             success=True,
             message=f"Created {element_type}: {properties.get('name', 'unnamed')}",
@@ -137,7 +180,8 @@ async def modify_design(request: DesignRequest):
 
         logger.info(f"Modify request: {request.dict()}")
 
-        result = penpot_client.modify_element(
+        result = await job_scheduler.run(
+            penpot_client.modify_element,
             request.element_id,
             request.properties
         )
@@ -167,7 +211,7 @@ async def get_state(query: StateQuery):
     try:
         logger.info(f"State query: {query.dict()}")
 
-        result = penpot_client.get_state(query.dict())
+        result = await job_scheduler.run(penpot_client.get_state, query.dict())
 
         return StateResponse(
             success=True,
@@ -186,6 +230,119 @@ async def get_state(query: StateQuery):
         )
 
 
+@app.post("/design/lint", response_model=LintResponse)
+async def lint_design(request: LintRequest):
+    """
+    Lint the design for contrast, touch-target and brand-color issues.
+
+    Only elements changed since the previous run are re-checked.
+    """
+    try:
+        logger.info(f"Lint request: project={request.project}, full={request.full}")
+
+        elements = request.elements
+        if elements is None:
+            result = await job_scheduler.run(penpot_client.get_state, request.query.dict())
+            elements = result.get("elements", [])
+
+        issues, checked = design_linter.lint(
+            elements,
+            request.project or "compel-english",
+            full=request.full
+        )
+
+        return LintResponse(
+            success=True,
+            issues=issues,
+            checked_count=checked,
+            total_count=len(elements)
+        )
+
+    except Exception as e:
+        logger.error(f"Lint failed: {e}", exc_info=True)
+        return LintResponse(
+            success=False,
+            error={
+                "code": "LINT_FAILED",
+                "message": str(e)
+            }
+        )
+
+
+def _job_response(job: Job, include_result: bool = False) -> JobResponse:
+    """Build API response for a background job."""
+    return JobResponse(
+        success=job.status != JobStatus.FAILED,
+        job_id=job.id,
+        kind=job.kind,
+        priority=job.priority,
+        status=job.status,
+        completed=job.completed,
+        total=len(job.steps),
+        progress=job.progress,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+        result=job.result if include_result else None,
+        error=job.error
+    )
+
+
+@app.post("/jobs", response_model=JobResponse, status_code=202)
+async def submit_job(request: JobRequest, response: Response):
+    """
+    Queue a long-running design operation.
+
+    Returns immediately with a job id; poll /jobs/{job_id} for progress
+    and fetch /jobs/{job_id}/result once it has finished.
+    """
+    try:
+        logger.info(f"Job request: {request.kind.value} ({request.priority.value})")
+        job = await job_scheduler.submit(request)
+        return _job_response(job)
+
+    except ValueError as e:
+        logger.error(f"Job submit failed: {e}")
+        response.status_code = 400
+        return JobResponse(
+            success=False,
+            error={
+                "code": "JOB_INVALID",
+                "message": str(e)
+            }
+        )
+
+    except RuntimeError as e:
+        logger.error(f"Job submit rejected: {e}")
+        response.status_code = 503
+        return JobResponse(
+            success=False,
+            error={
+                "code": "JOB_UNAVAILABLE",
+                "message": str(e)
+            }
+        )
+
+
+@app.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """Get status and progress of a background job."""
+    job = job_scheduler.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return _job_response(job)
+
+
+@app.get("/jobs/{job_id}/result", response_model=JobResponse)
+async def get_job_result(job_id: str):
+    """Get the result of a finished background job."""
+    job = job_scheduler.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    if not job.finished:
+        raise HTTPException(status_code=409, detail=f"Job not finished: {job.status.value}")
+    return _job_response(job, include_result=True)
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -194,7 +351,8 @@ async def root():
         "version": "1.0.0",
         "status": "running",
         "docs": "/docs",
-        "health": "/health"
+        "health": "/health",
+        "jobs": "/jobs"
     }
 
 
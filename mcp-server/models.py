@@ -77,3 +77,88 @@ class HealthResponse(BaseModel):
     status: str
     penpot_connected: bool
     version: str = "1.0.0"
+
+
+class JobKind(str, Enum):
+    """Supported background job kinds."""
+    STATE = "state"  # Full design state dump
+    BATCH = "batch"  # Sequence of raw plugin commands
+
+
+class JobPriority(str, Enum):
+    """Scheduling priority; interactive work always runs first."""
+    INTERACTIVE = "interactive"
+    NORMAL = "normal"
+    BULK = "bulk"
+
+
+class JobStatus(str, Enum):
+    """Lifecycle state of a background job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobRequest(BaseModel):
+    """Request to run a long design operation in the background."""
+    kind: JobKind
+    priority: JobPriority = JobPriority.BULK
+    query: Optional[StateQuery] = None  # For state jobs
+    commands: List[Dict[str, Any]] = Field(default_factory=list)  # For batch jobs
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "kind": "batch",
+                "priority": "bulk",
+                "commands": [
+                    {"operation": "createBoard", "properties": {"name": "Landing"}},
+                    {"operation": "createRectangle", "properties": {"name": "Hero"}}
+                ]
+            }
+        }
+
+
+class JobResponse(BaseModel):
+    """Status, progress and (once finished) result of a background job."""
+    success: bool
+    job_id: Optional[str] = None
+    kind: Optional[JobKind] = None
+    priority: Optional[JobPriority] = None
+    status: Optional[JobStatus] = None
+    completed: int = 0
+    total: int = 0
+    progress: float = 0.0
+    created_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[Dict[str, Any]] = None
+
+
+class LintRequest(BaseModel):
+    """Request to lint the current design (or the given elements)."""
+    project: Optional[str] = "compel-english"
+    query: StateQuery = Field(default_factory=StateQuery)
+    elements: Optional[List[Dict[str, Any]]] = None  # Skip getState when provided
+    full: bool = False  # Re-check everything, ignoring cached results
+
+
+class LintIssue(BaseModel):
+    """A single lint finding."""
+    element_id: str
+    element_name: Optional[str] = None
+    rule: str  # contrast | touch_target | brand_color
+    severity: str  # error | warning
+    message: str
+    value: float
+    threshold: float
+
+
+class LintResponse(BaseModel):
+    """Design lint results."""
+    success: bool
+    issues: List[LintIssue] = Field(default_factory=list)
+    checked_count: int = 0
+    total_count: int = 0
+    error: Optional[Dict[str, Any]] = None
@@ -2,11 +2,19 @@
 
 import requests
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Plugin operation for each creatable element type
+CREATE_OPERATIONS = {
+    "rectangle": "createRectangle",
+    "ellipse": "createEllipse",
+    "text": "createText",
+    "board": "createBoard"
+}
+
 
 class PenPotClient:
     """Client for PenPot plugin HTTP API."""
@@ -92,6 +100,37 @@ class PenPotClient:
         }
         return self.execute_command(command)
 
+    def create_tree(self, nodes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create a parent/child operation graph in a single plugin call.
+
+        Args:
+            nodes: Translator nodes {"ref", "parent", "element_type", "properties"},
+                parents before children
+
+        Returns:
+            Response from plugin with the root "id" and created "elements"
+
+        Raises:
+            ValueError: If a node has an unsupported element type
+        """
+        operations = []
+        for node in nodes:
+            if node["element_type"] not in CREATE_OPERATIONS:
+                raise ValueError(f"Unsupported element type: {node['element_type']}")
+            operations.append({
+                "ref": node["ref"],
+                "parent": node.get("parent"),
+                "operation": CREATE_OPERATIONS[node["element_type"]],
+                "properties": node["properties"]
+            })
+
+        command = {
+            "operation": "createTree",
+            "operations": operations
+        }
+        return self.execute_command(command)
+
     def modify_element(self, element_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
         """Modify an existing element."""
         command = {
@@ -0,0 +1,228 @@
+"""Tests for background job scheduler."""
+
+import asyncio
+import threading
+import pytest
+import json
+from jobs import Job, JobScheduler
+from models import JobKind, JobPriority, JobRequest, JobStatus
+
+
+class FakeClient:
+    """Records executed commands instead of talking to PenPot."""
+
+    def __init__(self):
+        self.calls = []
+
+    def execute_command(self, command):
+        self.calls.append(command["operation"])
+        if command["operation"] == "getState":
+            return {"elements": [{"id": "a"}, {"id": "b"}]}
+        return {"id": f"{command['operation']}-{len(self.calls)}"}
+
+    def create_text(self, properties):
+        self.calls.append("interactive")
+        return {"id": "text-1"}
+
+
+def batch(*operations, priority=JobPriority.BULK):
+    return JobRequest(
+        kind=JobKind.BATCH,
+        priority=priority,
+        commands=[{"operation": op, "properties": {}} for op in operations]
+    )
+
+
+async def drain(scheduler):
+    await scheduler._queue.join()
+    await scheduler.stop()
+
+
+def test_batch_job_runs_all_steps():
+    async def scenario():
+        scheduler = JobScheduler(FakeClient())
+        await scheduler.start()
+        job = await scheduler.submit(batch("createBoard", "createRectangle"))
+        await drain(scheduler)
+        return job
+
+    job = asyncio.run(scenario())
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.progress == 1.0
+    assert len(job.result["results"]) == 2
+
+
+class FailingClient(FakeClient):
+    """Plugin reports an error for text creation."""
+
+    def execute_command(self, command):
+        if command["operation"] == "createText":
+            self.calls.append(command["operation"])
+            return {"success": False, "error": "Failed to create text shape"}
+        return super().execute_command(command)
+
+
+def test_plugin_error_fails_job():
+    client = FailingClient()
+
+    async def scenario():
+        scheduler = JobScheduler(client)
+        await scheduler.start()
+        job = await scheduler.submit(batch("createBoard", "createText", "createRectangle"))
+        await drain(scheduler)
+        return job
+
+    job = asyncio.run(scenario())
+    assert job.status == JobStatus.FAILED
+    assert job.error == {"code": "JOB_FAILED", "message": "Failed to create text shape"}
+    assert job.completed == 1
+    assert client.calls == ["createBoard", "createText"]
+
+
+def test_state_job_result():
+    async def scenario():
+        scheduler = JobScheduler(FakeClient())
+        await scheduler.start()
+        job = await scheduler.submit(JobRequest(kind=JobKind.STATE))
+        await drain(scheduler)
+        return job
+
+    job = asyncio.run(scenario())
+    assert job.result["total_count"] == 2
+
+
+class BlockingClient(FakeClient):
+    """Bulk steps block until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def execute_command(self, command):
+        self.release.wait(5)
+        return super().execute_command(command)
+
+
+def test_interactive_not_blocked_by_bulk():
+    client = BlockingClient()
+
+    async def scenario():
+        scheduler = JobScheduler(client, max_concurrency=1)
+        await scheduler.start()
+        job = await scheduler.submit(batch("createRectangle", "createRectangle"))
+        await asyncio.sleep(0.05)  # Let the bulk step start and block
+        result = await scheduler.run(client.create_text, {})
+        assert not job.finished
+        client.release.set()
+        await drain(scheduler)
+        return result
+
+    assert asyncio.run(scenario()) == {"id": "text-1"}
+    assert client.calls[0] == "interactive"
+
+
+def test_invalid_batch_rejected():
+    async def scenario():
+        scheduler = JobScheduler(FakeClient())
+        with pytest.raises(ValueError):
+            await scheduler.submit(JobRequest(kind=JobKind.BATCH))
+        with pytest.raises(ValueError):
+            await scheduler.submit(JobRequest(kind=JobKind.BATCH, commands=[{"properties": {}}]))
+
+    asyncio.run(scenario())
+
+
+def test_finished_jobs_pruned():
+    async def scenario():
+        scheduler = JobScheduler(FakeClient(), max_finished_jobs=2)
+        await scheduler.start()
+        jobs = [await scheduler.submit(batch("createBoard")) for _ in range(4)]
+        await drain(scheduler)
+        return scheduler, jobs
+
+    scheduler, jobs = asyncio.run(scenario())
+    assert [scheduler.get(job.id) for job in jobs[:2]] == [None, None]
+    assert all(scheduler.get(job.id) for job in jobs[2:])
+
+
+def test_persisted_jobs_resume(tmp_path):
+    persist_path = tmp_path / "jobs.json"
+
+    async def enqueue_only():
+        scheduler = JobScheduler(FakeClient(), persist_path=str(persist_path))
+        return (await scheduler.submit(batch("createBoard", "createText"))).id
+
+    async def resume():
+        scheduler = JobScheduler(FakeClient(), persist_path=str(persist_path))
+        await scheduler.start()
+        await drain(scheduler)
+        return scheduler
+
+    job_id = asyncio.run(enqueue_only())
+    scheduler = asyncio.run(resume())
+    assert scheduler.get(job_id).status == JobStatus.SUCCEEDED
+
+    reloaded = JobScheduler(FakeClient(), persist_path=str(persist_path))
+    reloaded._load()
+    assert reloaded.get(job_id).status == JobStatus.SUCCEEDED
+
+
+def test_finished_jobs_not_rewritten(tmp_path):
+    persist_path = tmp_path / "jobs.json"
+
+    async def scenario():
+        scheduler = JobScheduler(FakeClient(), persist_path=str(persist_path), max_finished_jobs=1)
+        await scheduler.start()
+        first = await scheduler.submit(JobRequest(kind=JobKind.STATE))
+        await scheduler._queue.join()
+        second = await scheduler.submit(batch("createBoard"))
+        await drain(scheduler)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    # Unfinished file no longer carries finished results
+    assert json.loads(persist_path.read_text()) == []
+    # Each finished job has its own file; pruned jobs' files are removed
+    finished_dir = tmp_path / "jobs-finished"
+    assert [p.name for p in finished_dir.iterdir()] == [f"{second.id}.json"]
+
+
+def test_interrupted_steps_on_restart(tmp_path):
+    persist_path = tmp_path / "jobs.json"
+    create = Job(JobKind.BATCH, JobPriority.BULK, [{"operation": "createBoard"}, {"operation": "createText"}])
+    create.in_flight = 0
+    state = Job(JobKind.STATE, JobPriority.BULK, [{"operation": "getState", "query": {}}])
+    state.in_flight = 0
+    persist_path.write_text(json.dumps([create.to_dict(), state.to_dict()]))
+
+    client = FakeClient()
+
+    async def resume():
+        scheduler = JobScheduler(client, persist_path=str(persist_path))
+        await scheduler.start()
+        await drain(scheduler)
+        return scheduler
+
+    scheduler = asyncio.run(resume())
+    assert scheduler.get(create.id).error["code"] == "JOB_INTERRUPTED"
+    assert scheduler.get(state.id).status == JobStatus.SUCCEEDED
+    assert client.calls == ["getState"]
+
+    reloaded = JobScheduler(client, persist_path=str(persist_path))
+    reloaded._load()
+    assert reloaded.get(create.id).error["code"] == "JOB_INTERRUPTED"
+
+
+def test_stopped_scheduler_rejects_calls():
+    client = FakeClient()
+
+    async def scenario():
+        scheduler = JobScheduler(client)
+        await scheduler.start()
+        await scheduler.stop()
+        with pytest.raises(RuntimeError):
+            await scheduler.run(client.create_text, {})
+        with pytest.raises(RuntimeError):
+            await scheduler.submit(batch("createBoard"))
+
+    asyncio.run(scenario())
@@ -0,0 +1,111 @@
+"""Tests for design lint engine."""
+
+import pytest
+from lint import DesignLinter, contrast_ratio, hex_to_rgb
+
+
+def element(element_id, type="rect", name="Box", x=0, y=0, width=100, height=100, fill=None, opacity=None, **extra):
+    fills = [{"fillColor": fill}] if fill else []
+    if fill and opacity is not None:
+        fills[0]["fillOpacity"] = opacity
+    return {"id": element_id, "type": type, "name": name, "x": x, "y": y,
+            "width": width, "height": height, "fills": fills, **extra}
+
+
+def rules(issues, element_id):
+    return {issue["rule"] for issue in issues if issue["element_id"] == element_id}
+
+
+def test_contrast_ratio_black_on_white():
+    ratio = contrast_ratio(hex_to_rgb(["#000000"]), hex_to_rgb(["#FFFFFF"]))
+    assert ratio[0] == pytest.approx(21.0)
+
+
+def test_low_contrast_text_on_background():
+    linter = DesignLinter()
+    issues, _ = linter.lint([
+        element("card", width=400, height=200, fill="#2E3434"),
+        element("dim", type="text", x=10, y=10, width=100, height=20, fill="#444444"),
+        element("light", type="text", x=10, y=50, width=100, height=20, fill="#FFFFFF"),
+    ])
+    assert "contrast" in rules(issues, "dim")
+    assert "contrast" not in rules(issues, "light")
+
+
+def test_fill_opacity_in_contrast():
+    linter = DesignLinter()
+    issues, _ = linter.lint([
+        element("page", width=800, height=800, fill="#FFFFFF"),
+        element("overlay", x=10, y=10, width=400, height=400, fill="#000000", opacity=0.1),
+        element("faint", type="text", x=20, y=20, width=100, height=20, fill="#000000", opacity=0.2),
+        element("solid", type="text", x=20, y=60, width=100, height=20, fill="#000000"),
+    ])
+    # Faint black text on white fails; the translucent overlay is not its background
+    assert rules(issues, "faint") == {"contrast"}
+    assert not rules(issues, "solid")
+
+
+def test_string_and_mixed_font_sizes():
+    linter = DesignLinter()
+    issues, _ = linter.lint([
+        # #777777 on white is ~4.48:1: passes as large text only
+        element("mixed", type="text", width=100, height=20, fill="#777777", fontSize="mixed"),
+        element("large", type="text", y=40, width=100, height=20, fill="#777777", fontSize="32"),
+        element("odd", type="text", y=80, width=100, height=20, fill="#000000", opacity="mixed"),
+    ])
+    assert rules(issues, "mixed") == {"contrast"}
+    assert not rules(issues, "large")
+    assert not rules(issues, "odd")
+
+
+def test_small_button_flagged():
+    linter = DesignLinter()
+    issues, _ = linter.lint([
+        element("small", name="Primary Button", width=120, height=32),
+        element("big", name="Primary Button", width=200, height=50),
+        element("box", name="Card", width=20, height=20),
+        element("icons", name="Social Icons", width=20, height=20),
+        element("table", name="Data Table", width=20, height=20),
+        element("banner", name="LinkedIn banner", width=20, height=20),
+        element("frame", type="board", name="Button Row", width=20, height=20),
+    ])
+    assert rules(issues, "small") == {"touch_target"}
+    assert rules(issues, "icons") == {"touch_target"}
+    for element_id in ("big", "box", "table", "banner", "frame"):
+        assert not rules(issues, element_id)
+
+
+def test_brand_color_drift():
+    linter = DesignLinter()
+    issues, _ = linter.lint([
+        element("exact", fill="#FF5733"),
+        element("drift", fill="#FF5A30"),
+        element("other", fill="#0000FF"),
+    ])
+    assert rules(issues, "drift") == {"brand_color"}
+    assert not rules(issues, "exact")
+    assert not rules(issues, "other")
+
+
+def test_incremental_recheck():
+    linter = DesignLinter()
+    page = [
+        element("bg", width=400, height=200, fill="#FFFFFF"),
+        element("label", type="text", x=10, y=10, width=100, height=20, fill="#000000"),
+        element("button", name="Button", width=200, height=50),
+    ]
+    issues, checked = linter.lint(page)
+    assert checked == 3
+    assert not issues
+
+    issues, checked = linter.lint(page)
+    assert checked == 0
+
+    # Darkening the background re-checks the text sitting on it
+    page[0] = element("bg", width=400, height=200, fill="#111111")
+    issues, checked = linter.lint(page)
+    assert checked == 2
+    assert rules(issues, "label") == {"contrast"}
+
+    _, checked = linter.lint(page, full=True)
+    assert checked == 3
@@ -32,3 +32,85 @@ def test_text_element():
     element_type, props = translator.parse_command('create text "Hello World"')
     assert element_type == "text"
     assert props["text"] == "Hello World"
+
+
+def test_earliest_keyword_wins():
+    element_type, _ = translator.parse_command("create a heading inside a box")
+    assert element_type == "text"
+
+
+def test_compound_command_graph():
+    nodes = translator.parse_compound(
+        "create a hero board with a heading, subtitle and two primary buttons"
+    )
+    assert [n["element_type"] for n in nodes] == ["board", "text", "text", "rectangle", "rectangle"]
+    assert all(n["parent"] == "n0" for n in nodes[1:])
+    assert nodes[1]["properties"]["fontFamily"] == "Inter"
+    assert nodes[2]["properties"]["fontFamily"] == "Open Sans"
+    assert [n["properties"]["name"] for n in nodes[3:]] == ["Primary Button 1", "Primary Button 2"]
+    assert nodes[3]["properties"]["fills"][0]["fillColor"] == "#FF5733"
+
+
+def test_counted_siblings():
+    nodes = translator.parse_compound("create three cards")
+    assert len(nodes) == 3
+    assert all(n["parent"] is None for n in nodes)
+    assert len({n["properties"]["x"] for n in nodes}) == 3
+
+
+def test_simple_command_stays_single():
+    nodes = translator.parse_compound("create a button with rounded corners")
+    assert len(nodes) == 1
+    assert nodes[0]["properties"]["borderRadius"] == 12
+
+
+def test_button_with_text_stays_single():
+    nodes = translator.parse_compound('create a button with text "Buy now"')
+    assert len(nodes) == 1
+    assert nodes[0]["element_type"] == "rectangle"
+    assert nodes[0]["properties"]["borderRadius"] == 8
+    assert nodes[0]["properties"]["name"] == "Buy now"
+
+    nodes = translator.parse_compound("create a primary button with a label")
+    assert len(nodes) == 1
+    assert nodes[0]["properties"]["fills"][0]["fillColor"] == "#FF5733"
+
+
+def test_non_container_parent_keeps_type():
+    nodes = translator.parse_compound("create a circle with two buttons")
+    assert nodes[0]["element_type"] == "ellipse"
+    assert all(n["parent"] is None for n in nodes)
+    assert nodes[1]["properties"]["y"] > nodes[0]["properties"]["height"]
+
+
+def test_card_container_becomes_board():
+    nodes = translator.parse_compound("create a card with a heading")
+    assert nodes[0]["element_type"] == "board"
+    assert nodes[1]["parent"] == "n0"
+
+
+def test_count_is_capped():
+    with pytest.raises(ValueError):
+        translator.parse_compound("create 200000 cards")
+    with pytest.raises(ValueError):
+        translator.parse_compound("create a board with " + ", ".join(["50 buttons"] * 5))
+    assert len(translator.parse_compound("create 50 cards")) == 50
+
+
+def test_quoted_text_not_singularised():
+    nodes = translator.parse_compound('create a frame with a title "Our Buttons"')
+    assert nodes[1]["properties"]["name"] == "Our Buttons"
+    assert nodes[1]["properties"]["text"] == "Our Buttons"
+
+
+def test_separators_inside_quotes_ignored():
+    nodes = translator.parse_compound('create a board with a heading "Learn, practice and speak"')
+    assert len(nodes) == 2
+    assert nodes[1]["properties"]["text"] == "Learn, practice and speak"
+
+    nodes = translator.parse_compound('create a card with text "Rock and roll"')
+    assert nodes[1]["properties"]["text"] == "Rock and roll"
+
+    nodes = translator.parse_compound('create a board "Talk with us" with a button')
+    assert nodes[0]["properties"]["name"] == "Talk with us"
+    assert len(nodes) == 2
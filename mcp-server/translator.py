@@ -1,12 +1,47 @@
 """Translate natural language to PenPot commands."""
 
 import re
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from config import project_config
 import logging
 
 logger = logging.getLogger(__name__)
 
+COUNT_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10
+}
+
+# Upper bounds on what one command may create
+MAX_COUNT = 50
+MAX_NODES = 200
+
+# Splits "X with Y" into container and children
+CHILDREN_SEPARATOR = r'\s+(?:with|containing|including)\s+'
+
+# Splits "a, b and c" into clauses
+CLAUSE_SEPARATOR = r'\s*,\s*(?:and\s+)?|\s+and\s+'
+
+HEADING_KEYWORDS = ("heading", "headline", "title")
+
+# Parents that become boards holding their children
+CONTAINER_KEYWORDS = ("board", "frame", "artboard", "card")
+
+
+def _split_unquoted(pattern: str, text: str, maxsplit: int = 0) -> List[str]:
+    """re.split (case-insensitive) that ignores separators inside double-quoted text."""
+    # Blank out quoted spans so separators inside them can't match
+    masked = re.sub(r'"[^"]*"', lambda m: '"' + "\0" * (len(m.group()) - 2) + '"', text)
+
+    parts, last = [], 0
+    for i, match in enumerate(re.finditer(pattern, masked, flags=re.IGNORECASE)):
+        if maxsplit and i >= maxsplit:
+            break
+        parts.append(text[last:match.start()])
+        last = match.end()
+    parts.append(text[last:])
+    return parts
+
 
 class CommandTranslator:
     """Translates natural language commands to PenPot operations."""
@@ -22,6 +57,11 @@ class CommandTranslator:
             "text": "text",
             "label": "text",
             "heading": "text",
+            "headline": "text",
+            "title": "text",
+            "subtitle": "text",
+            "paragraph": "text",
+            "caption": "text",
             "board": "board",
             "frame": "board",
             "artboard": "board"
@@ -46,36 +86,212 @@ class CommandTranslator:
         Returns:
             Tuple of (element_type, properties_dict)
         """
-        nl_lower = natural_language.lower()
-
         # Determine element type
-        element_type = self._detect_element_type(nl_lower)
+        element_type = self._detect_element_type(natural_language.lower())
 
         # Extract properties
-        properties = self._extract_properties(nl_lower, element_type, project)
+        properties = self._extract_properties(natural_language, element_type, project)
 
         logger.info(f"Parsed '{natural_language}' → {element_type} with {properties}")
 
         return element_type, properties
 
-    def _detect_element_type(self, text: str) -> str:
-        """Detect what type of element to create."""
+    def parse_compound(self, natural_language: str, project: str = "compel-english") -> List[Dict[str, Any]]:
+        """
+        Parse a possibly compound command into an operation graph.
+
+        "a hero board with a heading, subtitle and two primary buttons"
+        becomes a board node plus four child nodes referencing it, laid
+        out inside the board and styled from the project's brand config.
+
+        Only containers (board, frame, card) get children. For other
+        shapes, text clauses describe the shape itself ("a button with
+        text \"Buy now\"" stays one rectangle); clauses naming other
+        elements are created as siblings below it.
+
+        Args:
+            natural_language: Command, simple or compound
+            project: Project name for brand configuration
+
+        Returns:
+            List of nodes {"ref", "parent", "element_type", "properties"},
+            parents always before their children
+        """
+        config = project_config.get_project(project)
+        parts = _split_unquoted(CHILDREN_SEPARATOR, natural_language, maxsplit=1)
+
+        if len(parts) == 2:
+            children = [
+                self._parse_clause(clause, project)
+                for clause in _split_unquoted(CLAUSE_SEPARATOR, parts[1].strip(" ."))
+                if clause.strip()
+            ]
+            children = [child for child in children if child is not None]
+            is_container = any(
+                re.search(rf'\b{k}s?\b', parts[0].lower()) for k in CONTAINER_KEYWORDS
+            )
+
+            if children and not is_container and any(child[1] != "text" for child in children):
+                parent_type, parent_properties = self.parse_command(parts[0], project)
+                parent_properties.update(x=0, y=0)
+                parent = {"ref": "n0", "parent": None, "element_type": parent_type, "properties": parent_properties}
+                gap = config.get("spacing", {}).get("unit", 8) * 2
+                top = self._node_height(parent_properties) + gap
+                nodes = [parent] + self._expand(children, config, parent=None, start=1, top=top)
+                logger.info(f"Parsed '{natural_language}' → {parent_type} with {len(nodes) - 1} siblings")
+                return nodes
+
+            if children and is_container:
+                # Only boards can hold children, so a "card" container becomes one
+                _, parent_properties = self.parse_command(parts[0], project)
+                parent = {"ref": "n0", "parent": None, "element_type": "board", "properties": parent_properties}
+                nodes = [parent] + self._expand(children, config, parent="n0", start=1)
+
+                # Grow the board to fit its children
+                padding = config.get("spacing", {}).get("unit", 8) * 4
+                right = max(n["properties"]["x"] + (n["properties"].get("width") or 0) for n in nodes[1:])
+                bottom = max(n["properties"]["y"] + self._node_height(n["properties"]) for n in nodes[1:])
+                parent_properties["width"] = max(parent_properties.get("width") or 0, right + padding)
+                parent_properties["height"] = max(parent_properties.get("height") or 0, bottom + padding)
+
+                logger.info(f"Parsed '{natural_language}' → board with {len(nodes) - 1} children")
+                return nodes
+
+        clause = self._parse_clause(natural_language, project)
+        if clause is None or clause[0] == 1:
+            element_type, properties = self.parse_command(natural_language, project)
+            return [{"ref": "n0", "parent": None, "element_type": element_type, "properties": properties}]
+
+        nodes = self._expand([clause], config, parent=None, start=0)
+        logger.info(f"Parsed '{natural_language}' → {len(nodes)} {clause[1]} elements")
+        return nodes
+
+    def _parse_clause(self, clause: str, project: str) -> Optional[Tuple[int, str, Dict[str, Any]]]:
+        """
+        Parse one clause like "two primary buttons" into (count, element_type, properties).
+
+        Raises:
+            ValueError: If the count exceeds MAX_COUNT
+        """
+        words = clause.split()
+        count = 1
+        while words and words[0].lower() in ["create", "add", "make", "the"]:
+            words = words[1:]
+        if words and (words[0].isdigit() or words[0].lower() in COUNT_WORDS):
+            count = int(words[0]) if words[0].isdigit() else COUNT_WORDS[words[0].lower()]
+            words = words[1:]
+        if not words or count < 1:
+            return None
+        if count > MAX_COUNT:
+            raise ValueError(f"Cannot create {count} elements in one clause (max {MAX_COUNT})")
+
+        # Only keyword matching sees the singular form; the clause itself
+        # (including quoted names and text) is extracted untouched
+        text = " ".join(words)
+        keyword_text = self._singularize(text.lower())
+
+        element_type = self._detect_element_type(keyword_text, default=None)
+        if element_type is None:
+            return None
+
+        properties = self._extract_properties(text, element_type, project)
+        if not re.search(r'"([^"]+)"', text):
+            # Generated names read "Primary Button 1", not "Primary Buttons 1"
+            properties["name"] = self._singularize(properties["name"])
+        self._apply_brand_defaults(keyword_text, element_type, properties, project_config.get_project(project))
+        return count, element_type, properties
+
+    def _singularize(self, text: str) -> str:
+        """Singularise element keywords ("buttons" → "button")."""
+        for keyword in self.element_keywords:
+            text = re.sub(rf'\b({keyword})(?:es|s)\b', r'\1', text, flags=re.IGNORECASE)
+        return text
+
+    def _apply_brand_defaults(self, text: str, element_type: str, properties: Dict[str, Any], config: Dict[str, Any]):
+        """Give compound children consistent brand styling."""
+        typography = config.get("typography", {})
+        brand_colors = config.get("brand_colors", {})
+
+        if element_type == "text":
+            is_heading = any(re.search(rf'\b{k}\b', text) for k in HEADING_KEYWORDS)
+            properties["fontFamily"] = typography.get("heading" if is_heading else "body", properties["fontFamily"])
+            properties.setdefault("fontSize", 32 if is_heading else 18 if "subtitle" in text else 16)
+            if properties.get("text") == "Text":
+                properties["text"] = properties["name"]
+        elif "button" in text and "fills" not in properties and "primary" in brand_colors:
+            properties["fills"] = [{"fillColor": brand_colors["primary"]}]
+
+    def _expand(
+        self,
+        clauses: List[Tuple[int, str, Dict[str, Any]]],
+        config: Dict[str, Any],
+        parent: Optional[str],
+        start: int,
+        top: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Expand counted clauses into named, positioned nodes; one row per clause.
+
+        Raises:
+            ValueError: If the graph would exceed MAX_NODES
+        """
+        total = start + sum(count for count, _, _ in clauses)
+        if total > MAX_NODES:
+            raise ValueError(f"Command would create {total} elements (max {MAX_NODES})")
+
+        unit = config.get("spacing", {}).get("unit", 8)
+        padding = unit * 4 if parent else 0
+        gap = unit * 2
+
+        nodes = []
+        y = padding + top
+        for count, element_type, properties in clauses:
+            x = padding
+            row_height = self._node_height(properties)
+            for i in range(count):
+                node_properties = dict(properties, x=x, y=y)
+                if count > 1:
+                    node_properties["name"] = f"{properties['name']} {i + 1}"
+                nodes.append({
+                    "ref": f"n{start + len(nodes)}",
+                    "parent": parent,
+                    "element_type": element_type,
+                    "properties": node_properties
+                })
+                x += (properties.get("width") or 0) + gap
+            y += row_height + gap
+
+        return nodes
+
+    def _node_height(self, properties: Dict[str, Any]) -> int:
+        """Height of a node, estimating text line height from its font size."""
+        return properties.get("height") or int(properties.get("fontSize", 16) * 1.5)
+
+    def _detect_element_type(self, text: str, default: Optional[str] = "rectangle") -> Optional[str]:
+        """
+        Detect what type of element to create.
+
+        The keyword appearing earliest in the text wins; default (rectangle
+        unless overridden) is returned if none match.
+        """
+        best_type, best_position = default, None
         for keyword, element_type in self.element_keywords.items():
-            if keyword in text:
-                return element_type
+            match = re.search(rf'\b{keyword}s?\b', text)
+            if match and (best_position is None or match.start() < best_position):
+                best_type, best_position = element_type, match.start()
 
-        # Default to rectangle if unclear
-        return "rectangle"
+        return best_type
 
-    def _extract_properties(self, text: str, element_type: str, project: str) -> Dict[str, Any]:
+    def _extract_properties(self, natural_language: str, element_type: str, project: str) -> Dict[str, Any]:
         """Extract properties from natural language."""
         properties = {}
+        text = natural_language.lower()
 
         # Get project configuration
         config = project_config.get_project(project)
 
-        # Extract name
-        properties["name"] = self._extract_name(text)
+        # Extract name (quoted names keep their case)
+        properties["name"] = self._extract_name(natural_language)
 
         # Extract dimensions
         width, height = self._extract_dimensions(text, element_type)
@@ -96,7 +312,7 @@ class CommandTranslator:
 
         # Extract text content (for text elements)
         if element_type == "text":
-            content = self._extract_text_content(text)
+            content = self._extract_text_content(natural_language)
             if content:
                 properties["text"] = content
 
@@ -117,7 +333,7 @@ class CommandTranslator:
         words = text.split()
         name_words = []
         for word in words:
-            if word in ["create", "add", "make", "a", "an", "the"]:
+            if word.lower() in ["create", "add", "make", "a", "an", "the"]:
                 continue
             name_words.append(word.capitalize())
 
@@ -195,7 +411,7 @@ class CommandTranslator:
             return quoted.group(1)
 
         # Look for "text: something"
-        content_match = re.search(r'text[:\s]+(.+?)(?:\s+with|\s+at|$)', text)
+        content_match = re.search(r'text[:\s]+(.+?)(?:\s+with|\s+at|$)', text, re.IGNORECASE)
         if content_match:
             return content_match.group(1).strip()
 
@@ -10,25 +10,29 @@ console.log("AI Design Bridge Plugin initializing...");
 // ============================================================================
 // SHAPE CREATION OPERATIONS
 // ============================================================================
+function buildRectangle(properties) {
+    const shape = penpot.createRectangle();
+    // Set properties
+    if (properties.name) {
+        shape.name = properties.name;
+    }
+    if (properties.width && properties.height) {
+        shape.resize(properties.width, properties.height);
+    }
+    if (properties.fills) {
+        shape.fills = properties.fills;
+    }
+    if (properties.strokes) {
+        shape.strokes = properties.strokes;
+    }
+    if (properties.borderRadius !== undefined) {
+        shape.borderRadius = properties.borderRadius;
+    }
+    return shape;
+}
 function createRectangle(properties) {
     try {
-        const shape = penpot.createRectangle();
-        // Set properties
-        if (properties.name) {
-            shape.name = properties.name;
-        }
-        if (properties.width && properties.height) {
-            shape.resize(properties.width, properties.height);
-        }
-        if (properties.fills) {
-            shape.fills = properties.fills;
-        }
-        if (properties.strokes) {
-            shape.strokes = properties.strokes;
-        }
-        if (properties.borderRadius !== undefined) {
-            shape.borderRadius = properties.borderRadius;
-        }
+        const shape = buildRectangle(properties);
         console.log(`Created rectangle: ${shape.name} (${shape.id})`);
         return {
             success: true,
@@ -47,21 +51,25 @@ function createRectangle(properties) {
         };
     }
 }
+function buildEllipse(properties) {
+    const shape = penpot.createEllipse();
+    if (properties.name) {
+        shape.name = properties.name;
+    }
+    if (properties.width && properties.height) {
+        shape.resize(properties.width, properties.height);
+    }
+    if (properties.fills) {
+        shape.fills = properties.fills;
+    }
+    if (properties.strokes) {
+        shape.strokes = properties.strokes;
+    }
+    return shape;
+}
 function createEllipse(properties) {
     try {
-        const shape = penpot.createEllipse();
-        if (properties.name) {
-            shape.name = properties.name;
-        }
-        if (properties.width && properties.height) {
-            shape.resize(properties.width, properties.height);
-        }
-        if (properties.fills) {
-            shape.fills = properties.fills;
-        }
-        if (properties.strokes) {
-            shape.strokes = properties.strokes;
-        }
+        const shape = buildEllipse(properties);
         console.log(`Created ellipse: ${shape.name} (${shape.id})`);
         return {
             success: true,
@@ -80,27 +88,31 @@ function createEllipse(properties) {
         };
     }
 }
+function buildText(properties) {
+    const shape = penpot.createText("Text");
+    if (!shape) {
+        throw new Error("Failed to create text shape");
+    }
+    if (properties.name) {
+        shape.name = properties.name;
+    }
+    if (properties.text) {
+        shape.characters = properties.text;
+    }
+    if (properties.fontFamily) {
+        console.log(`Font ${properties.fontFamily} requested (using default for now)`);
+    }
+    if (properties.fontSize) {
+        shape.fontSize = properties.fontSize;
+    }
+    if (properties.fills) {
+        shape.fills = properties.fills;
+    }
+    return shape;
+}
 function createText(properties) {
     try {
-        const shape = penpot.createText("Text");
-        if (!shape) {
-            throw new Error("Failed to create text shape");
-        }
-        if (properties.name) {
-            shape.name = properties.name;
-        }
-        if (properties.text) {
-            shape.characters = properties.text;
-        }
-        if (properties.fontFamily) {
-            console.log(`Font ${properties.fontFamily} requested (using default for now)`);
-        }
-        if (properties.fontSize) {
-            shape.fontSize = properties.fontSize;
-        }
-        if (properties.fills) {
-            shape.fills = properties.fills;
-        }
+        const shape = buildText(properties);
         console.log(`Created text: ${shape.name} (${shape.id})`);
         return {
             success: true,
@@ -120,18 +132,22 @@ function createText(properties) {
         };
     }
 }
+function buildBoard(properties) {
+    const board = penpot.createBoard();
+    if (properties.name) {
+        board.name = properties.name;
+    }
+    if (properties.width && properties.height) {
+        board.resize(properties.width, properties.height);
+    }
+    if (properties.fills) {
+        board.fills = properties.fills;
+    }
+    return board;
+}
 function createBoard(properties) {
     try {
-        const board = penpot.createBoard();
-        if (properties.name) {
-            board.name = properties.name;
-        }
-        if (properties.width && properties.height) {
-            board.resize(properties.width, properties.height);
-        }
-        if (properties.fills) {
-            board.fills = properties.fills;
-        }
+        const board = buildBoard(properties);
         console.log(`Created board: ${board.name} (${board.id})`);
         return {
             success: true,
@@ -234,7 +250,9 @@ function getState(query = {}) {
                 x: node.x,
                 y: node.y,
                 width: node.width,
-                height: node.height
+                height: node.height,
+                fills: node.fills,
+                fontSize: node.fontSize
             });
             if ('children' in node && node.children) {
                 for (const child of node.children) {
@@ -268,6 +286,94 @@ function getState(query = {}) {
     }
 }
 // ============================================================================
+// BATCH OPERATIONS
+// ============================================================================
+const SHAPE_BUILDERS = {
+    createRectangle: buildRectangle,
+    createEllipse: buildEllipse,
+    createText: buildText,
+    createBoard: buildBoard
+};
+// All-or-nothing: if any node fails, every shape created so far is removed
+// and the error reply lists the elements that were rolled back.
+function createTree(operations) {
+    var _a;
+    const shapes = {};
+    const elements = [];
+    // Created shapes not (yet) inside another created shape
+    const roots = [];
+    try {
+        for (const op of operations) {
+            const build = SHAPE_BUILDERS[op.operation];
+            if (!build) {
+                throw new Error(`${op.ref}: unsupported operation ${op.operation}`);
+            }
+            const properties = op.properties || {};
+            const shape = build(properties);
+            roots.push(shape);
+            if (op.parent) {
+                const parent = shapes[op.parent];
+                if (!parent) {
+                    throw new Error(`${op.ref}: parent ${op.parent} not created`);
+                }
+                parent.appendChild(shape);
+                roots.pop();
+                // Translator offsets are relative to the parent board
+                if (properties.x !== undefined) {
+                    shape.parentX = properties.x;
+                }
+                if (properties.y !== undefined) {
+                    shape.parentY = properties.y;
+                }
+            }
+            else {
+                if (properties.x !== undefined) {
+                    shape.x = properties.x;
+                }
+                if (properties.y !== undefined) {
+                    shape.y = properties.y;
+                }
+            }
+            shapes[op.ref] = shape;
+            elements.push({
+                ref: op.ref,
+                parent: op.parent || null,
+                id: shape.id,
+                name: shape.name,
+                type: shape.type
+            });
+        }
+        console.log(`Created tree: ${elements.length} elements`);
+        return {
+            success: true,
+            data: {
+                id: (_a = elements[0]) === null || _a === void 0 ? void 0 : _a.id,
+                elements
+            }
+        };
+    }
+    catch (error) {
+        console.error("Failed to create tree:", error);
+        // Removing a root shape also removes the children appended to it
+        for (const shape of roots) {
+            try {
+                shape.remove();
+            }
+            catch (removeError) {
+                console.error("Failed to roll back shape:", removeError);
+            }
+        }
+        return {
+            success: false,
+            error: error.message,
+            data: {
+                elements,
+                rolledBack: true
+            }
+        };
+    }
+}
+// ============================================================================
 // COMMAND DISPATCHER
 // ============================================================================
 function executeCommand(command) {
@@ -291,6 +397,8 @@ function executeCommand(command) {
             return modifyElement(command.element_id, command.properties || {});
         case 'getState':
             return getState(command.query || {});
+        case 'createTree':
+            return createTree(command.operations || []);
         default:
             return {
                 success: false,
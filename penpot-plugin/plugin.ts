@@ -18,6 +18,7 @@ interface Command {
   properties?: any;
   element_id?: string;
   query?: any;
+  operations?: any[];
 }
 
 interface CommandResult {
@@ -30,30 +31,36 @@ interface CommandResult {
 // SHAPE CREATION OPERATIONS
 // ============================================================================
 
-function createRectangle(properties: any): CommandResult {
-  try {
-    const shape = penpot.createRectangle();
+function buildRectangle(properties: any): any {
+  const shape = penpot.createRectangle();
 
-    // Set properties
-    if (properties.name) {
-      shape.name = properties.name;
-    }
+  // Set properties
+  if (properties.name) {
+    shape.name = properties.name;
+  }
 
-    if (properties.width && properties.height) {
-      shape.resize(properties.width, properties.height);
-    }
+  if (properties.width && properties.height) {
+    shape.resize(properties.width, properties.height);
+  }
 
-    if (properties.fills) {
-      shape.fills = properties.fills;
-    }
+  if (properties.fills) {
+    shape.fills = properties.fills;
+  }
 
-    if (properties.strokes) {
-      shape.strokes = properties.strokes;
-    }
+  if (properties.strokes) {
+    shape.strokes = properties.strokes;
+  }
 
-    if (properties.borderRadius !== undefined) {
-      shape.borderRadius = properties.borderRadius;
-    }
+  if (properties.borderRadius !== undefined) {
+    shape.borderRadius = properties.borderRadius;
+  }
+
+  return shape;
+}
+
+function createRectangle(properties: any): CommandResult {
+  try {
+    const shape = buildRectangle(properties);
 
     console.log(`Created rectangle: ${shape.name} (${shape.id})`);
 
@@ -74,25 +81,31 @@ function createRectangle(properties: any): CommandResult {
   }
 }
 
-function createEllipse(properties: any): CommandResult {
-  try {
-    const shape = penpot.createEllipse();
+function buildEllipse(properties: any): any {
+  const shape = penpot.createEllipse();
 
-    if (properties.name) {
-      shape.name = properties.name;
-    }
+  if (properties.name) {
+    shape.name = properties.name;
+  }
 
-    if (properties.width && properties.height) {
-      shape.resize(properties.width, properties.height);
-    }
+  if (properties.width && properties.height) {
+    shape.resize(properties.width, properties.height);
+  }
 
-    if (properties.fills) {
-      shape.fills = properties.fills;
-    }
+  if (properties.fills) {
+    shape.fills = properties.fills;
+  }
 
-    if (properties.strokes) {
-      shape.strokes = properties.strokes;
-    }
+  if (properties.strokes) {
+    shape.strokes = properties.strokes;
+  }
+
+  return shape;
+}
+
+function createEllipse(properties: any): CommandResult {
+  try {
+    const shape = buildEllipse(properties);
 
     console.log(`Created ellipse: ${shape.name} (${shape.id})`);
 
@@ -113,33 +126,39 @@ function createEllipse(properties: any): CommandResult {
   }
 }
 
-function createText(properties: any): CommandResult {
-  try {
-    const shape = penpot.createText("Text");
+function buildText(properties: any): any {
+  const shape = penpot.createText("Text");
 
-    if (!shape) {
-      throw new Error("Failed to create text shape");
-    }
+  if (!shape) {
+    throw new Error("Failed to create text shape");
+  }
 
-    if (properties.name) {
-      shape.name = properties.name;
-    }
+  if (properties.name) {
+    shape.name = properties.name;
+  }
 
-    if (properties.text) {
-      shape.characters = properties.text;
-    }
+  if (properties.text) {
+    shape.characters = properties.text;
+  }
 
-    if (properties.fontFamily) {
-      console.log(`Font ${properties.fontFamily} requested (using default for now)`);
-    }
+  if (properties.fontFamily) {
+    console.log(`Font ${properties.fontFamily} requested (using default for now)`);
+  }
 
-    if (properties.fontSize) {
-      shape.fontSize = properties.fontSize;
-    }
+  if (properties.fontSize) {
+    shape.fontSize = properties.fontSize;
+  }
 
-    if (properties.fills) {
-      shape.fills = properties.fills;
-    }
+  if (properties.fills) {
+    shape.fills = properties.fills;
+  }
+
+  return shape;
+}
+
+function createText(properties: any): CommandResult {
+  try {
+    const shape = buildText(properties);
 
     console.log(`Created text: ${shape.name} (${shape.id})`);
 
@@ -161,21 +180,27 @@ function createText(properties: any): CommandResult {
   }
 }
 
-function createBoard(properties: any): CommandResult {
-  try {
-    const board = penpot.createBoard();
+function buildBoard(properties: any): any {
+  const board = penpot.createBoard();
 
-    if (properties.name) {
-      board.name = properties.name;
-    }
+  if (properties.name) {
+    board.name = properties.name;
+  }
 
-    if (properties.width && properties.height) {
-      board.resize(properties.width, properties.height);
-    }
+  if (properties.width && properties.height) {
+    board.resize(properties.width, properties.height);
+  }
 
-    if (properties.fills) {
-      board.fills = properties.fills;
-    }
+  if (properties.fills) {
+    board.fills = properties.fills;
+  }
+
+  return board;
+}
+
+function createBoard(properties: any): CommandResult {
+  try {
+    const board = buildBoard(properties);
 
     console.log(`Created board: ${board.name} (${board.id})`);
 
@@ -296,7 +321,9 @@ function getState(query: any = {}): CommandResult {
         x: node.x,
         y: node.y,
         width: node.width,
-        height: node.height
+        height: node.height,
+        fills: node.fills,
+        fontSize: node.fontSize
       });
 
       if ('children' in node && node.children) {
@@ -333,6 +360,104 @@ function getState(query: any = {}): CommandResult {
   }
 }
 
+// ============================================================================
+// BATCH OPERATIONS
+// ============================================================================
+
+const SHAPE_BUILDERS: Record<string, (properties: any) => any> = {
+  createRectangle: buildRectangle,
+  createEllipse: buildEllipse,
+  createText: buildText,
+  createBoard: buildBoard
+};
+
+// All-or-nothing: if any node fails, every shape created so far is removed
+// and the error reply lists the elements that were rolled back.
+function createTree(operations: any[]): CommandResult {
+  const shapes: Record<string, any> = {};
+  const elements: any[] = [];
+  // Created shapes not (yet) inside another created shape
+  const roots: any[] = [];
+
+  try {
+    for (const op of operations) {
+      const build = SHAPE_BUILDERS[op.operation];
+      if (!build) {
+        throw new Error(`${op.ref}: unsupported operation ${op.operation}`);
+      }
+
+      const properties = op.properties || {};
+      const shape = build(properties);
+      roots.push(shape);
+
+      if (op.parent) {
+        const parent = shapes[op.parent];
+        if (!parent) {
+          throw new Error(`${op.ref}: parent ${op.parent} not created`);
+        }
+        parent.appendChild(shape);
+        roots.pop();
+
+        // Translator offsets are relative to the parent board
+        if (properties.x !== undefined) {
+          shape.parentX = properties.x;
+        }
+
+        if (properties.y !== undefined) {
+          shape.parentY = properties.y;
+        }
+      } else {
+        if (properties.x !== undefined) {
+          shape.x = properties.x;
+        }
+
+        if (properties.y !== undefined) {
+          shape.y = properties.y;
+        }
+      }
+
+      shapes[op.ref] = shape;
+      elements.push({
+        ref: op.ref,
+        parent: op.parent || null,
+        id: shape.id,
+        name: shape.name,
+        type: shape.type
+      });
+    }
+
+    console.log(`Created tree: ${elements.length} elements`);
+
+    return {
+      success: true,
+      data: {
+        id: elements[0]?.id,
+        elements
+      }
+    };
+  } catch (error: any) {
+    console.error("Failed to create tree:", error);
+
+    // Removing a root shape also removes the children appended to it
+    for (const shape of roots) {
+      try {
+        shape.remove();
+      } catch (removeError: any) {
+        console.error("Failed to roll back shape:", removeError);
+      }
+    }
+
+    return {
+      success: false,
+      error: error.message,
+      data: {
+        elements,
+        rolledBack: true
+      }
+    };
+  }
+}
+
 // ============================================================================
 // COMMAND DISPATCHER
 // ============================================================================
@@ -365,6 +490,9 @@ function executeCommand(command: Command): CommandResult {
     case 'getState':
       return getState(command.query || {});
 
+    case 'createTree':
+      return createTree(command.operations || []);
+
     default:
       return {
         success: false,